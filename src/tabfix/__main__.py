@@ -2,10 +2,25 @@
 import sys
 import argparse
 from pathlib import Path
-
-from .core import TabFix, Colors, print_color, GitignoreMatcher
+from collections import Counter
+
+from .core import (
+    TabFix,
+    Colors,
+    print_color,
+    disable_color,
+    GitignoreMatcher,
+    find_gitignore_root,
+    iter_files,
+)
 from .config import TabFixConfig, ConfigLoader, init_project
-from .autoformat import get_available_formatters, create_autoformat_config, Formatter, FileProcessor
+from .autoformat import (
+    get_available_formatters,
+    create_autoformat_config,
+    Formatter,
+    FileProcessor,
+    FormatCache,
+)
 
 
 def create_parser() -> argparse.ArgumentParser:
@@ -87,6 +102,11 @@ Examples:
         "--formatters",
         help="Comma-separated list of formatters to use (e.g. black,isort)"
     )
+    autoformat_group.add_argument(
+        "--cache",
+        action="store_true",
+        help="Skip files unchanged since they last formatted cleanly"
+    )
     autoformat_group.add_argument(
         "--init-autoformat",
         action="store_true",
@@ -199,6 +219,12 @@ Examples:
         action="store_true",
         help="Create backup files (.bak)"
     )
+    mode_group.add_argument(
+        "-j", "--jobs",
+        type=int,
+        help="Number of parallel jobs for fixing and formatting "
+             "(default: CPU count, 1 disables parallelism)"
+    )
     mode_group.add_argument(
         "--diff",
         nargs=2,
@@ -247,8 +273,7 @@ def main():
     args = parser.parse_args()
 
     if args.no_color:
-        global Colors
-        Colors = type("Colors", (), {k: "" for k in dir(Colors) if not k.startswith("_")})()
+        disable_color()
 
     if args.init:
         success = init_project(Path.cwd())
@@ -298,8 +323,9 @@ def main():
         return
 
     files_to_process = []
+    git_mode = args.git_staged or args.git_unstaged or args.git_all_changed
 
-    if args.git_staged or args.git_unstaged or args.git_all_changed:
+    if git_mode:
         if args.git_staged:
             files = fixer.get_git_files("staged")
         elif args.git_unstaged:
@@ -307,91 +333,106 @@ def main():
         else:
             files = fixer.get_git_files("all_changed")
         files_to_process.extend(files)
-    else:
-        for path_str in args.paths:
-            path = Path(path_str)
-
-            if not path.exists():
-                if not args.quiet:
-                    print_color(f"Warning: Path not found: {path}", Colors.YELLOW)
-                continue
-
-            if path.is_file():
-                files_to_process.append(path)
-            elif path.is_dir():
-                if args.recursive:
-                    pattern = "**/*"
-                else:
-                    pattern = "*"
-
-                for filepath in path.glob(pattern):
-                    if filepath.is_file():
-                        files_to_process.append(filepath)
-
-    if not files_to_process:
-        if not args.quiet:
-            print_color("No files to process", Colors.YELLOW)
-        return
 
     gitignore_matcher = None
-    if not args.no_gitignore and files_to_process:
-        root_dir = Path.cwd()
-        for filepath in files_to_process:
-            if filepath.is_absolute():
-                potential_root = filepath.parent
-            else:
-                potential_root = (Path.cwd() / filepath).parent
-
-            gitignore_path = potential_root / ".gitignore"
-            if gitignore_path.exists():
-                root_dir = potential_root
-                break
+    if not args.no_gitignore:
+        if git_mode:
+            search_paths = files_to_process
+        else:
+            search_paths = [Path(p) for p in args.paths]
 
+        root_dir = find_gitignore_root(search_paths)
         gitignore_matcher = GitignoreMatcher(root_dir)
         if args.verbose:
             print_color(f"Using .gitignore from: {root_dir}", Colors.CYAN)
 
     processed_files = []
+    skipped = 0
     for filepath in files_to_process:
         if gitignore_matcher and gitignore_matcher.should_ignore(filepath):
+            skipped += 1
             continue
         processed_files.append(filepath)
 
-    if args.verbose and gitignore_matcher:
-        skipped = len(files_to_process) - len(processed_files)
-        if skipped > 0:
-            print_color(f"Skipping {skipped} files due to .gitignore", Colors.DIM)
+    if not git_mode:
+        for path_str in args.paths:
+            path = Path(path_str)
+
+            if not path.exists():
+                if not args.quiet:
+                    print_color(f"Warning: Path not found: {path}", Colors.YELLOW)
+                continue
+
+            if path.is_file():
+                if gitignore_matcher and gitignore_matcher.should_ignore(path):
+                    skipped += 1
+                    continue
+                processed_files.append(path)
+            elif path.is_dir():
+                ignored = []
+                processed_files.extend(
+                    iter_files(path, args.recursive, gitignore_matcher, ignored)
+                )
+                skipped += len(ignored)
+
+    if args.verbose and skipped > 0:
+        print_color(f"Skipping {skipped} files due to .gitignore", Colors.DIM)
+
+    processed_files = list(dict.fromkeys(processed_files))
+
+    if args.skip_binary:
+        processed_files = fixer.filter_binary_files(processed_files, args)
 
     if not processed_files:
         if not args.quiet:
-            print_color("No files to process after applying .gitignore", Colors.YELLOW)
+            if skipped:
+                print_color(
+                    "No files to process after applying .gitignore", Colors.YELLOW
+                )
+            else:
+                print_color("No files to process", Colors.YELLOW)
         return
 
+    results = fixer.process_files(
+        processed_files, args, gitignore_matcher, jobs=args.jobs
+    )
+
     try:
         from tqdm import tqdm
         if args.progress and not args.interactive:
-            iterator = tqdm(processed_files, desc="Processing", unit="file", disable=args.quiet)
+            iterator = tqdm(
+                results,
+                total=len(processed_files),
+                desc="Processing",
+                unit="file",
+                disable=args.quiet,
+            )
         else:
-            iterator = processed_files
+            iterator = results
     except ImportError:
-        iterator = processed_files
-
-    autoformat_stats = {"formatted": 0, "failed": 0, "checked": 0}
-
-    for filepath in iterator:
-        file_changed = fixer.process_file(filepath, args, gitignore_matcher)
-
-        if file_processor and (args.autoformat or args.check_format):
+        iterator = results
+
+    processed_files = [filepath for filepath, _ in iterator]
+
+    autoformat_stats = Counter()
+    format_cache = None
+
+    if file_processor and (args.autoformat or args.check_format):
+        mode = "Checking" if args.check_format else "Formatting"
+        if args.cache:
+            format_cache = FormatCache()
+        format_results = file_processor.process_files(
+            processed_files,
+            formatters=args.formatter_list,
+            check_only=args.check_format,
+            jobs=args.jobs,
+            cache=format_cache
+        )
+
+        for filepath, success, messages in format_results:
             if args.verbose:
-                mode = "Checking" if args.check_format else "Formatting"
                 print_color(f"{mode} {filepath}", Colors.CYAN)
 
-            success, messages = file_processor.process_file(
-                filepath,
-                formatters=args.formatter_list,
-                check_only=args.check_format
-            )
-
             if args.check_format:
                 autoformat_stats["checked"] += 1
                 if not success and args.verbose:
@@ -409,6 +450,9 @@ def main():
                         for msg in messages:
                             print_color(f"  ✗ {msg}", Colors.RED)
 
+        if format_cache is not None:
+            format_cache.save()
+
     fixer.print_stats(args)
 
     if args.autoformat or args.check_format:
@@ -422,6 +466,10 @@ def main():
             print_color(f"Files formatted: {autoformat_stats['formatted']}", Colors.GREEN)
             if autoformat_stats['failed'] > 0:
                 print_color(f"Files failed: {autoformat_stats['failed']}", Colors.RED)
+        if format_cache is not None and format_cache.hits:
+            print_color(
+                f"Files unchanged since last run: {format_cache.hits}", Colors.DIM
+            )
 
 
 if __name__ == "__main__":
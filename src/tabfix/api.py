@@ -10,7 +10,7 @@ import time
 from datetime import datetime
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
-from .core import TabFix
+from .core import TabFix, iter_files
 from .config import TabFixConfig
 from .autoformat import FileProcessor, get_available_formatters
 
@@ -140,6 +140,14 @@ class GitIntegrator:
         return [self.repo_path / f for f in files]
 
 
+class _ConfigArgs:
+    def __init__(self, config: TabFixConfig):
+        for key, value in config.to_dict().items():
+            setattr(self, key, value)
+        if not hasattr(self, 'check_only'):
+            setattr(self, 'check_only', getattr(config, 'check_only', False))
+
+
 class TabFixAPI:
     def __init__(self, config: Optional[TabFixConfig] = None, enable_backups: bool = False):
         self.config = config or TabFixConfig()
@@ -186,14 +194,7 @@ class TabFixAPI:
         if self.backup_handler and not (self.config.dry_run or self.config.check_only):
             result.backup_path = self.backup_handler.create_backup(filepath)
 
-        class Args:
-            def __init__(self, config):
-                for key, value in config.to_dict().items():
-                    setattr(self, key, value)
-                if not hasattr(self, 'check_only'):
-                    setattr(self, 'check_only', getattr(config, 'check_only', False))
-
-        args = Args(self.config)
+        args = _ConfigArgs(self.config)
 
         try:
             changed = self.tabfix.process_file(filepath, args, None)
@@ -230,13 +231,10 @@ class TabFixAPI:
             result.failed_files += 1
             return result
 
-        pattern = "**/*" if recursive else "*"
-        files = list(directory.glob(pattern))
-
-        with ThreadPoolExecutor(max_workers=4) as executor:
+        with ThreadPoolExecutor(max_workers=self.config.jobs or 4) as executor:
             future_to_file = {
                 executor.submit(self.process_file, file): file
-                for file in files if file.is_file()
+                for file in iter_files(directory, recursive)
             }
 
             for future in as_completed(future_to_file):
@@ -296,8 +294,7 @@ class AsyncTabFixAPI:
         if not directory.exists():
             return result
 
-        pattern = "**/*" if recursive else "*"
-        files = [f for f in directory.glob(pattern) if f.is_file()]
+        files = list(iter_files(directory, recursive))
 
         tasks = [self.process_file_async(f) for f in files]
 
@@ -341,21 +338,19 @@ class DirectoryWatcher:
         self.running = False
 
     def _scan_initial(self):
-        for f in self.directory.rglob("*"):
-            if f.is_file():
-                self._mtimes[f] = f.stat().st_mtime
+        for f in iter_files(self.directory):
+            self._mtimes[f] = f.stat().st_mtime
 
     def _detect_changes(self) -> List[Path]:
         changed = []
         current_files = set()
 
-        for f in self.directory.rglob("*"):
-            if f.is_file():
-                current_files.add(f)
-                mtime = f.stat().st_mtime
-                if f not in self._mtimes or self._mtimes[f] != mtime:
-                    self._mtimes[f] = mtime
-                    changed.append(f)
+        for f in iter_files(self.directory):
+            current_files.add(f)
+            mtime = f.stat().st_mtime
+            if f not in self._mtimes or self._mtimes[f] != mtime:
+                self._mtimes[f] = mtime
+                changed.append(f)
 
         deleted = set(self._mtimes.keys()) - current_files
         for f in deleted:
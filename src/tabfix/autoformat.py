@@ -1,10 +1,12 @@
 import subprocess
 import shutil
 from pathlib import Path
-from typing import List, Tuple, Optional, Dict, Set
+from typing import List, Tuple, Optional, Dict, Set, Iterable, Iterator, Callable
 from enum import Enum
+from concurrent.futures import ThreadPoolExecutor
 import json
 import os
+import hashlib
 
 
 class Formatter(Enum):
@@ -19,15 +21,36 @@ class Formatter(Enum):
     RUSTFMT = "rustfmt"
 
 
+_FORMATTER_ARGS: Dict[Formatter, Tuple[Tuple[str, ...], Tuple[str, ...]]] = {
+    Formatter.BLACK: ((), ("--check",)),
+    Formatter.RUFF: (("format",), ("format", "--check")),
+    Formatter.ISORT: ((), ("--check-only",)),
+    Formatter.PRETTIER: ((), ("--check",)),
+    Formatter.CLANGFORMAT: ((), ("--dry-run", "-Werror")),
+    Formatter.GOFMT: ((), ("-d",)),
+}
+
+
 class FormatterManager:
+    _which_cache: Dict[str, Optional[str]] = {}
+
     def __init__(self, spaces_per_tab: int = 4):
         self.spaces_per_tab = spaces_per_tab
         self._available_formatters: Set[Formatter] = set()
         self._detect_formatters()
 
     def _detect_formatters(self):
+        missing = [
+            formatter.value for formatter in Formatter
+            if formatter.value not in self._which_cache
+        ]
+        if missing:
+            with ThreadPoolExecutor(max_workers=len(missing)) as executor:
+                for name, path in zip(missing, executor.map(shutil.which, missing)):
+                    FormatterManager._which_cache[name] = path
+
         for formatter in Formatter:
-            if shutil.which(formatter.value) is not None:
+            if self._which_cache[formatter.value] is not None:
                 self._available_formatters.add(formatter)
 
     def is_formatter_available(self, formatter: Formatter) -> bool:
@@ -37,39 +60,108 @@ class FormatterManager:
         return [f.value for f in self._available_formatters]
 
     def format_file(self, filepath: Path, formatters: List[Formatter], check_only: bool = False) -> Tuple[bool, List[str]]:
-        results = []
+        return self.format_batch([filepath], formatters, check_only)[0]
+
+    def format_batch(self, filepaths: List[Path], formatters: List[Formatter],
+                     check_only: bool = False) -> List[Tuple[bool, List[str]]]:
+        return [
+            _summarize(file_results)
+            for file_results in self.run_batch(filepaths, formatters, check_only)
+        ]
+
+    def run_batch(self, filepaths: List[Path], formatters: List[Formatter],
+                  check_only: bool = False) -> List[List[Tuple[bool, str]]]:
+        run = self._check_formatting if check_only else self._apply_formatter
+
+        batch_results = {}
+        if check_only:
+            available = [f for f in formatters if self.is_formatter_available(f)]
+            if len(available) > 1:
+                with ThreadPoolExecutor(max_workers=len(available)) as executor:
+                    checks = executor.map(
+                        lambda formatter: run(filepaths, formatter), available
+                    )
+                    batch_results = dict(zip(available, checks))
+
+        results = [[] for _ in filepaths]
         for formatter in formatters:
-            if self.is_formatter_available(formatter):
-                if check_only:
-                    result = self._check_formatting(filepath, formatter)
-                else:
-                    result = self._apply_formatter(filepath, formatter)
-                results.append(result)
+            if not self.is_formatter_available(formatter):
+                missing = (False, f"Formatter {formatter.value} not available")
+                outcome = [missing] * len(filepaths)
             else:
-                results.append((False, f"Formatter {formatter.value} not available"))
+                if formatter in batch_results:
+                    result = batch_results[formatter]
+                else:
+                    result = run(filepaths, formatter)
+                outcome = self._bisect(run, filepaths, formatter, result)
+
+            for file_results, result in zip(results, outcome):
+                file_results.append(result)
+
+        return results
+
+    def _bisect(
+        self,
+        run: Callable[[List[Path], Formatter], Tuple[bool, str]],
+        filepaths: List[Path],
+        formatter: Formatter,
+        result: Tuple[bool, str],
+    ) -> List[Tuple[bool, str]]:
+        if result[0] or len(filepaths) == 1:
+            return [result] * len(filepaths)
 
-        success = any(success for success, _ in results)
-        messages = [msg for _, msg in results if msg]
-        return success, messages
+        mid = len(filepaths) // 2
+        outcome = []
+        for half in (filepaths[:mid], filepaths[mid:]):
+            outcome.extend(self._bisect(run, half, formatter, run(half, formatter)))
+        return outcome
 
-    def _apply_formatter(self, filepath: Path, formatter: Formatter) -> Tuple[bool, str]:
-        cmd = self._build_formatter_command(filepath, formatter, fix=True)
+    def tool_stamp(self, formatters: List[Formatter]) -> str:
+        parts = []
+        for formatter in formatters:
+            path = self._which_cache.get(formatter.value)
+            try:
+                mtime = os.stat(path).st_mtime_ns if path else 0
+            except OSError:
+                mtime = 0
+            parts.append(f"{formatter.value}@{mtime}")
+        return ",".join(parts)
+
+    def _apply_formatter(
+        self, filepaths: List[Path], formatter: Formatter
+    ) -> Tuple[bool, str]:
+        cmd = self._build_formatter_command(filepaths, formatter, fix=True)
         try:
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
+            result = subprocess.run(
+                cmd,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                timeout=30 * len(filepaths),
+            )
             if result.returncode == 0:
                 return True, f"Formatted with {formatter.value}"
             else:
-                error_msg = result.stderr[:200] if result.stderr else "Unknown error"
+                if result.stderr:
+                    error_msg = result.stderr[:200].decode(errors="replace")
+                else:
+                    error_msg = "Unknown error"
                 return False, f"{formatter.value}: {error_msg}"
         except subprocess.TimeoutExpired:
             return False, f"{formatter.value}: Timeout"
         except Exception as e:
             return False, f"{formatter.value}: {str(e)}"
 
-    def _check_formatting(self, filepath: Path, formatter: Formatter) -> Tuple[bool, str]:
-        cmd = self._build_formatter_command(filepath, formatter, fix=False)
+    def _check_formatting(
+        self, filepaths: List[Path], formatter: Formatter
+    ) -> Tuple[bool, str]:
+        cmd = self._build_formatter_command(filepaths, formatter, fix=False)
         try:
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
+            result = subprocess.run(
+                cmd,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                timeout=30 * len(filepaths),
+            )
             if result.returncode == 0:
                 return True, f"OK ({formatter.value})"
             else:
@@ -79,44 +171,69 @@ class FormatterManager:
         except Exception as e:
             return False, f"{formatter.value}: {str(e)}"
 
-    def _build_formatter_command(self, filepath: Path, formatter: Formatter, fix: bool) -> List[str]:
-        base_cmd = [formatter.value]
+    def _build_formatter_command(
+        self, filepaths: List[Path], formatter: Formatter, fix: bool
+    ) -> List[str]:
+        fix_args, check_args = _FORMATTER_ARGS.get(formatter, ((), ()))
+        mode_args = fix_args if fix else check_args
+        return [formatter.value, *mode_args, *map(str, filepaths)]
 
-        if formatter == Formatter.BLACK:
-            if not fix:
-                base_cmd.append("--check")
-            base_cmd.append(str(filepath))
 
-        elif formatter == Formatter.RUFF:
-            if fix:
-                base_cmd.extend(["format", str(filepath)])
-            else:
-                base_cmd.extend(["format", "--check", str(filepath)])
+def _summarize(file_results: List[Tuple[bool, str]]) -> Tuple[bool, List[str]]:
+    return (
+        any(success for success, _ in file_results),
+        [msg for _, msg in file_results if msg],
+    )
 
-        elif formatter == Formatter.ISORT:
-            if not fix:
-                base_cmd.append("--check-only")
-            base_cmd.append(str(filepath))
 
-        elif formatter == Formatter.PRETTIER:
-            if not fix:
-                base_cmd.append("--check")
-            base_cmd.append(str(filepath))
+def default_format_cache_path() -> Path:
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    cwd = os.getcwd().encode("utf-8", "surrogateescape")
+    digest = hashlib.sha1(cwd).hexdigest()[:16]
+    return Path(cache_home) / "tabfix" / f"format-{digest}.json"
 
-        elif formatter == Formatter.CLANGFORMAT:
-            if not fix:
-                base_cmd.extend(["--dry-run", "-Werror"])
-            base_cmd.append(str(filepath))
 
-        elif formatter == Formatter.GOFMT:
-            if not fix:
-                base_cmd.append("-d")
-            base_cmd.append(str(filepath))
+class FormatCache:
+    def __init__(self, path: Optional[Path] = None):
+        self.path = path or default_format_cache_path()
+        self.hits = 0
+        self._entries: Dict[str, str] = {}
+        self._dirty = False
+        try:
+            with open(self.path, "rb") as f:
+                self._entries = json.loads(f.read())
+        except (OSError, ValueError):
+            pass
+
+    def _key(self, filepath: Path, stamp: str) -> Optional[str]:
+        try:
+            st = os.stat(filepath)
+        except OSError:
+            return None
+        return f"{st.st_mtime_ns}:{st.st_size}:{stamp}"
 
-        else:
-            base_cmd.append(str(filepath))
+    def is_fresh(self, filepath: Path, stamp: str) -> bool:
+        key = self._key(filepath, stamp)
+        return key is not None and self._entries.get(os.path.abspath(filepath)) == key
 
-        return base_cmd
+    def update(self, filepath: Path, stamp: str):
+        key = self._key(filepath, stamp)
+        if key is not None:
+            self._entries[os.path.abspath(filepath)] = key
+            self._dirty = True
+
+    def save(self):
+        if not self._dirty:
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, "w") as f:
+                json.dump(self._entries, f)
+        except OSError:
+            return
+        self._dirty = False
 
 
 class FileProcessor:
@@ -156,6 +273,63 @@ class FileProcessor:
 
         return self.formatter_manager.format_file(filepath, formatters_to_use, check_only)
 
+    def process_files(
+        self,
+        files: Iterable[Path],
+        formatters: Optional[List[Formatter]] = None,
+        check_only: bool = False,
+        jobs: Optional[int] = None,
+        batch_size: int = 256,
+        cache: Optional[FormatCache] = None,
+    ) -> Iterator[Tuple[Path, bool, List[str]]]:
+        groups: Dict[Tuple[Formatter, ...], List[Path]] = {}
+        stamps: Dict[Tuple[Formatter, ...], str] = {}
+        for filepath in files:
+            key = tuple(self.get_formatters_for_file(filepath, formatters))
+            if cache is not None and key:
+                if key not in stamps:
+                    stamps[key] = self.formatter_manager.tool_stamp(list(key))
+                if cache.is_fresh(filepath, stamps[key]):
+                    cache.hits += 1
+                    continue
+            groups.setdefault(key, []).append(filepath)
+
+        workers = jobs or os.cpu_count() or 1
+        batches = []
+        for key, group in groups.items():
+            size = min(batch_size, max(1, -(-len(group) // workers)))
+            for start in range(0, len(group), size):
+                batches.append((key, group[start:start + size]))
+
+        def process(
+            batch: Tuple[Tuple[Formatter, ...], List[Path]]
+        ) -> List[List[Tuple[bool, str]]]:
+            key, batch_files = batch
+            if not key:
+                unconfigured = (False, "No formatters configured for this file type")
+                return [[unconfigured] for _ in batch_files]
+            return self.formatter_manager.run_batch(batch_files, list(key), check_only)
+
+        def collect(
+            batch: Tuple[Tuple[Formatter, ...], List[Path]],
+            results: List[List[Tuple[bool, str]]],
+        ) -> Iterator[Tuple[Path, bool, List[str]]]:
+            key, batch_files = batch
+            for filepath, file_results in zip(batch_files, results):
+                if cache is not None and key and all(ok for ok, _ in file_results):
+                    cache.update(filepath, stamps[key])
+                yield (filepath, *_summarize(file_results))
+
+        workers = min(workers, len(batches))
+        if workers <= 1:
+            for batch in batches:
+                yield from collect(batch, process(batch))
+            return
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for batch, results in zip(batches, executor.map(process, batches)):
+                yield from collect(batch, results)
+
 
 def get_available_formatters() -> List[str]:
     manager = FormatterManager()
@@ -3,6 +3,7 @@ import json
 from pathlib import Path
 from typing import Any, Dict, Optional
 from dataclasses import dataclass, field, asdict
+from functools import lru_cache
 import os
 
 try:
@@ -15,6 +16,38 @@ except ImportError:
     except ImportError:
         TOML_AVAILABLE = False
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+
+CONFIG_NAMES = (
+    ".tabfixrc",
+    ".tabfixrc.json",
+    ".tabfixrc.toml",
+    ".tabfixrc.yaml",
+    ".tabfixrc.yml",
+    "pyproject.toml",
+    "tabfix.json",
+)
+_CONFIG_NAME_SET = frozenset(CONFIG_NAMES)
+
+
+@lru_cache(maxsize=None)
+def _find_config_in(directory: str) -> Optional[str]:
+    try:
+        with os.scandir(directory) as entries:
+            found = {entry.name for entry in entries if entry.name in _CONFIG_NAME_SET}
+    except OSError:
+        return None
+
+    for name in CONFIG_NAMES:
+        if name in found:
+            return os.path.join(directory, name)
+    return None
+
 
 @dataclass
 class TabFixConfig:
@@ -39,6 +72,7 @@ class TabFixConfig:
     verbose: bool = False
     quiet: bool = False
     no_color: bool = False
+    jobs: Optional[int] = None
 
     git_staged: bool = False
     git_unstaged: bool = False
@@ -65,22 +99,11 @@ class TabFixConfig:
 class ConfigLoader:
     @staticmethod
     def find_config_file(start_dir: Path) -> Optional[Path]:
-        config_names = [
-            ".tabfixrc",
-            ".tabfixrc.json",
-            ".tabfixrc.toml",
-            ".tabfixrc.yaml",
-            ".tabfixrc.yml",
-            "pyproject.toml",
-            "tabfix.json",
-        ]
-        
         current = start_dir
         while current != current.parent:
-            for name in config_names:
-                config_path = current / name
-                if config_path.exists():
-                    return config_path
+            config_path = _find_config_in(str(current))
+            if config_path:
+                return Path(config_path)
             current = current.parent
         return None
     
@@ -108,8 +131,8 @@ class ConfigLoader:
                 raise ImportError("YAML support requires PyYAML")
         
         elif suffix == ".json" or config_path.name == ".tabfixrc":
-            with open(config_path, "r", encoding="utf-8") as f:
-                return json.load(f)
+            with open(config_path, "rb") as f:
+                return _json_loads(f.read())
         
         else:
             return {}
@@ -139,6 +162,7 @@ class ConfigLoader:
             else:
                 return False
             
+            _find_config_in.cache_clear()
             return True
         
         except Exception as e:
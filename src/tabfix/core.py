@@ -7,10 +7,13 @@ import json
 import subprocess
 import shutil
 import fnmatch
+import mmap
 from pathlib import Path
-from typing import List, Tuple, Dict, Optional, Set, Any
+from typing import List, Tuple, Dict, Optional, Set, Any, Iterable, Iterator, Callable
 from datetime import datetime
 from collections import Counter
+from itertools import zip_longest
+from concurrent.futures import ProcessPoolExecutor
 
 try:
     from tqdm import tqdm
@@ -31,6 +34,31 @@ except ImportError:
     HAS_CHARSET_NORMALIZER = False
 
 
+_PARALLEL_CHUNK_SIZE = 64
+
+_BINARY_SNIFF_SIZE = 1024
+_BINARY_SUFFIXES = frozenset({
+    '.png', '.jpg', '.jpeg', '.gif', '.bmp', '.ico', '.webp',
+    '.pdf', '.zip', '.tar', '.gz', '.bz2', '.xz', '.rar', '.7z',
+    '.exe', '.dll', '.so', '.dylib', '.class',
+    '.pyc', '.pyo', '.pyd', '.o', '.obj', '.a', '.lib',
+    '.mp3', '.mp4', '.avi', '.mkv', '.mov',
+    '.ttf', '.otf', '.woff', '.woff2',
+    '.db', '.sqlite', '.mdb',
+})
+
+_TRAILING_WS_RE = re.compile(
+    rb"(?:[\t\x0b\x0c\x1c-\x1f ]|\xc2[\x85\xa0]|\xe1\x9a\x80"
+    rb"|\xe2\x80[\x80-\x8a\xa8\xa9\xaf]|\xe2\x81\x9f|\xe3\x80\x80)+(?=\r?\n|\Z)"
+)
+_TRAILING_WS_TEXT_RE = re.compile(r"[^\S\r\n]+(?=\r?\n|\Z)")
+_TAB_LINE_RE = re.compile(rb"^[^\t\n]*\t", re.MULTILINE)
+_TAB_LINE_TEXT_RE = re.compile(r"^[^\t\n]*\t", re.MULTILINE)
+_FixPass = Callable[[bytes], Tuple[bytes, Optional[str]]]
+
+_INDENT_RE = re.compile(r"^(?:(\t)|( +))[^\S\n]*\S", re.MULTILINE)
+
+
 class Colors:
     GREEN = "\033[92m"
     YELLOW = "\033[93m"
@@ -43,17 +71,51 @@ class Colors:
     DIM = "\033[2m"
 
 
+class _NoColors(Colors):
+    GREEN = YELLOW = RED = BLUE = CYAN = MAGENTA = END = BOLD = DIM = ""
+
+
+_USE_COLOR = sys.stdout.isatty()
+
+
+def disable_color():
+    global Colors, _USE_COLOR
+    Colors = _NoColors
+    _USE_COLOR = False
+
+
+if os.environ.get("NO_COLOR"):
+    disable_color()
+
+
 def print_color(text: str, color: str = Colors.END, end: str = "\n"):
-    if sys.stdout.isatty():
+    if _USE_COLOR:
         print(f"{color}{text}{Colors.END}", end=end)
     else:
         print(text, end=end)
 
 
+def print_color_lines(lines: List[Tuple[str, str]]):
+    if _USE_COLOR:
+        output = "".join(f"{color}{text}{Colors.END}\n" for text, color in lines)
+    else:
+        output = "".join(f"{text}\n" for text, _ in lines)
+    sys.stdout.write(output)
+    sys.stdout.flush()
+
+
+def _compile_globs(regexes: List[str]) -> "re.Pattern":
+    if not regexes:
+        return re.compile(r"(?!)")
+    return re.compile("|".join(f"(?:{r})" for r in regexes))
+
+
 class GitignoreMatcher:
     def __init__(self, root_dir: Path):
         self.root_dir = root_dir.resolve()
+        self._root_prefix = os.path.join(str(self.root_dir), "")
         self.patterns = []
+        self._dir_cache: Dict[str, bool] = {}
         self.load_gitignore()
 
     def load_gitignore(self):
@@ -112,25 +174,127 @@ class GitignoreMatcher:
         ]
         self.patterns.extend(default_patterns)
 
-    def should_ignore(self, path: Path) -> bool:
-        try:
-            rel_path = path.resolve().relative_to(self.root_dir)
-            rel_str = str(rel_path).replace("\\", "/")
-            if rel_str == ".":
+        dir_patterns = []
+        path_patterns = []
+        name_patterns = []
+        for pattern in self.patterns:
+            if pattern.endswith("/"):
+                dir_patterns.append(pattern[:-1])
+            elif pattern.startswith("**/") and "/" not in pattern[3:]:
+                name_patterns.append(pattern[3:])
+            elif "/" in pattern:
+                path_patterns.append(pattern)
+            else:
+                name_patterns.append(pattern)
+
+        self._dir_re = _compile_globs(
+            [re.escape(p) for p in dir_patterns]
+            + [fnmatch.translate(p) for p in dir_patterns]
+        )
+        self._dir_name_re = _compile_globs(
+            [fnmatch.translate(p) for p in dir_patterns if "/" not in p]
+        )
+        self._path_re = _compile_globs([fnmatch.translate(p) for p in path_patterns])
+        self._name_re = _compile_globs([fnmatch.translate(p) for p in name_patterns])
+
+    def should_ignore(self, path: Path, is_dir: bool = False) -> bool:
+        path_str = os.path.abspath(path)
+        if path_str.startswith(self._root_prefix):
+            rel_str = path_str[len(self._root_prefix):]
+        else:
+            try:
+                rel_str = str(path.resolve().relative_to(self.root_dir))
+            except ValueError:
                 return False
 
-            for pattern in self.patterns:
-                if pattern.endswith("/"):
-                    if rel_str.startswith(pattern[:-1]) or fnmatch.fnmatch(rel_str, pattern[:-1]):
-                        return True
-                else:
-                    if fnmatch.fnmatch(rel_str, pattern) or fnmatch.fnmatch(path.name, pattern):
-                        return True
-
+        rel_str = rel_str.replace("\\", "/")
+        if not rel_str or rel_str == ".":
             return False
-        except ValueError:
+
+        if is_dir:
+            return self._is_dir_ignored(rel_str)
+
+        parent, _, name = rel_str.rpartition("/")
+        if self._is_dir_ignored(parent):
+            return True
+        return self._matches(rel_str, name)
+
+    def _is_dir_ignored(self, rel_dir: str) -> bool:
+        if not rel_dir:
             return False
 
+        ignored = self._dir_cache.get(rel_dir)
+        if ignored is None:
+            parent, _, name = rel_dir.rpartition("/")
+            ignored = (
+                self._is_dir_ignored(parent)
+                or self._matches(rel_dir, name)
+                or bool(self._dir_name_re.match(name))
+            )
+            self._dir_cache[rel_dir] = ignored
+        return ignored
+
+    def _matches(self, rel_str: str, name: str) -> bool:
+        return bool(
+            self._name_re.match(name)
+            or self._path_re.match(rel_str)
+            or self._dir_re.match(rel_str)
+        )
+
+
+def _write_all(fd: int, data: bytes):
+    view = memoryview(data)
+    while view:
+        view = view[os.write(fd, view):]
+
+
+def find_gitignore_root(paths: Iterable[Path]) -> Path:
+    for path in paths:
+        if path.is_dir():
+            potential_root = path.absolute()
+        else:
+            potential_root = path.absolute().parent
+
+        if (potential_root / ".gitignore").exists():
+            return potential_root
+    return Path.cwd()
+
+
+def iter_files(
+    root: Path,
+    recursive: bool = True,
+    gitignore_matcher: Optional[GitignoreMatcher] = None,
+    ignored: Optional[List[Path]] = None,
+) -> Iterator[Path]:
+    pending = [root]
+    while pending:
+        directory = pending.pop()
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if not recursive:
+                            continue
+                        if gitignore_matcher and gitignore_matcher.should_ignore(
+                            Path(entry.path), is_dir=True
+                        ):
+                            if ignored is not None:
+                                ignored.append(Path(entry.path))
+                            continue
+                        pending.append(entry.path)
+                        continue
+                    if not entry.is_file():
+                        continue
+
+                    filepath = Path(entry.path)
+                    if gitignore_matcher and gitignore_matcher.should_ignore(filepath):
+                        if ignored is not None:
+                            ignored.append(filepath)
+                        continue
+                    yield filepath
+        except OSError:
+            continue
+
 
 class EncodingDetector:
     def __init__(self, confidence_threshold: float = 0.8):
@@ -503,6 +667,16 @@ class TabFix:
     def add_bom(self, content: bytes) -> bytes:
         return b"\xef\xbb\xbf" + content
 
+    def write_file(self, filepath: Path, content: bytes, bom: bool = False):
+        flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+        fd = os.open(filepath, flags, 0o644)
+        try:
+            if bom:
+                _write_all(fd, b"\xef\xbb\xbf")
+            _write_all(fd, content)
+        finally:
+            os.close(fd)
+
     def format_json(self, content: str) -> Tuple[str, bool]:
         try:
             parsed = json.loads(content)
@@ -526,11 +700,10 @@ class TabFix:
         lines2 = content2.split("\n")
 
         differences = []
-        max_lines = max(len(lines1), len(lines2))
 
-        for i in range(max_lines):
-            line1 = lines1[i] if i < len(lines1) else ""
-            line2 = lines2[i] if i < len(lines2) else ""
+        for i, (line1, line2) in enumerate(zip_longest(lines1, lines2, fillvalue="")):
+            if line1 == line2:
+                continue
 
             indent1 = len(line1) - len(line1.lstrip())
             indent2 = len(line2) - len(line2.lstrip())
@@ -598,17 +771,18 @@ class TabFix:
                 self.stats["json_formatted"] += 1
     
         if args.fix_mixed:
+            tab_count = content.count("\t")
+            tab_lines = len(_TAB_LINE_TEXT_RE.findall(content))
             content, indent_changes = self.fix_mixed_indentation(content)
             changes.extend(indent_changes)
-            if indent_changes:
-                self.stats["tabs_replaced"] += len(indent_changes)
-                self.stats["lines_fixed"] += len(indent_changes)
+            self.stats["tabs_replaced"] += tab_count
+            self.stats["lines_fixed"] += tab_lines
     
         if args.fix_trailing:
+            trailing_count = len(_TRAILING_WS_TEXT_RE.findall(content))
             content, trailing_changes = self.fix_trailing_spaces(content)
             changes.extend(trailing_changes)
-            if trailing_changes:
-                self.stats["lines_fixed"] += len(trailing_changes)
+            self.stats["lines_fixed"] += trailing_count
     
         if args.final_newline:
             content, newline_changes = self.ensure_final_newline(content)
@@ -668,111 +842,72 @@ class TabFix:
             else:
                 print_color("Please enter y, n, a, or q", Colors.RED)
 
-    def get_git_files(self, mode: str = "staged") -> List[Path]:
+    def get_git_files(self, mode: str = "staged") -> Iterator[Path]:
+        commands = {
+            "staged": ["git", "diff", "--cached", "--name-only", "--diff-filter=ACM"],
+            "unstaged": ["git", "diff", "--name-only", "--diff-filter=ACM"],
+            "all_changed": ["git", "status", "--porcelain"],
+        }
+        cmd = commands.get(mode)
+        if cmd is None:
+            return
+
         try:
-            if mode == "staged":
-                result = subprocess.run(
-                    ["git", "diff", "--cached", "--name-only", "--diff-filter=ACM"],
-                    capture_output=True,
-                    text=True,
-                    check=True,
-                )
-            elif mode == "unstaged":
-                result = subprocess.run(
-                    ["git", "diff", "--name-only", "--diff-filter=ACM"],
-                    capture_output=True,
-                    text=True,
-                    check=True,
-                )
-            elif mode == "all_changed":
-                result = subprocess.run(
-                    ["git", "status", "--porcelain"],
-                    capture_output=True,
-                    text=True,
-                    check=True,
-                )
-                files = []
-                for line in result.stdout.strip().split("\n"):
-                    if line:
-                        status = line[:2]
-                        filename = line[3:].strip()
-                        if status != "??":
-                            files.append(filename)
-                return [Path(f) for f in files if f]
-            else:
-                return []
+            process = subprocess.Popen(
+                cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True
+            )
+        except (OSError, ValueError):
+            return
 
-            files = [f.strip() for f in result.stdout.strip().split("\n") if f.strip()]
-            return [Path(f) for f in files]
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            return []
+        with process:
+            for line in process.stdout:
+                line = line.rstrip("\n")
+                if mode == "all_changed":
+                    if not line or line[:2] == "??":
+                        continue
+                    line = line[3:]
+
+                filename = line.strip()
+                if filename:
+                    yield Path(filename)
 
     def detect_indentation(self, content: str) -> Dict:
-        lines = content.split("\n")
         tab_lines = 0
-        space_lines = 0
-        space_counts = []
+        space_widths = Counter()
 
-        for line in lines:
-            if not line.strip():
-                continue
-            if line.startswith("\t"):
+        for match in _INDENT_RE.finditer(content):
+            if match.lastindex == 1:
                 tab_lines += 1
-            elif line.startswith(" "):
-                space_lines += 1
-                leading = len(line) - len(line.lstrip(" "))
-                if leading > 0:
-                    space_counts.append(leading)
+            else:
+                space_widths[match.end(2) - match.start(2)] += 1
 
+        space_lines = sum(space_widths.values())
         common_indent = None
-        if space_counts:
-            counter = Counter(space_counts)
-            if counter:
-                common_indent = counter.most_common(1)[0][0]
+        if space_widths:
+            common_indent = max(space_widths, key=space_widths.get)
 
         return {
             "uses_tabs": tab_lines > 0,
             "uses_spaces": space_lines > 0,
             "common_indent": common_indent,
             "mixed": tab_lines > 0 and space_lines > 0,
-            "total_lines": len(lines),
+            "total_lines": content.count("\n") + 1,
             "indented_lines": tab_lines + space_lines,
         }
 
     def fix_mixed_indentation(self, content: str) -> Tuple[str, List[str]]:
-        lines = content.split("\n")
-        fixed_lines = []
-        changes = []
-
-        for i, line in enumerate(lines, 1):
-            original = line
-            if "\t" in line:
-                fixed_line = line.replace("\t", " " * self.spaces_per_tab)
-                if fixed_line != original:
-                    fixed_lines.append(fixed_line)
-                    changes.append(f"Line {i}: Tabs → spaces")
-                else:
-                    fixed_lines.append(fixed_line)
-            else:
-                fixed_lines.append(line)
+        tab_count = content.count("\t")
+        if not tab_count:
+            return content, []
 
-        return "\n".join(fixed_lines), changes
+        fixed = content.replace("\t", " " * self.spaces_per_tab)
+        return fixed, [f"Tabs → spaces: {tab_count} replaced"]
 
     def fix_trailing_spaces(self, content: str) -> Tuple[str, List[str]]:
-        lines = content.split("\n")
-        fixed_lines = []
-        changes = []
-
-        for i, line in enumerate(lines, 1):
-            original_length = len(line)
-            fixed_line = line.rstrip()
-            if len(fixed_line) != original_length:
-                fixed_lines.append(fixed_line)
-                changes.append(f"Line {i}: Removed trailing spaces")
-            else:
-                fixed_lines.append(line)
-
-        return "\n".join(fixed_lines), changes
+        fixed, count = _TRAILING_WS_TEXT_RE.subn("", content)
+        if not count:
+            return content, []
+        return fixed, [f"Removed trailing spaces: {count} lines"]
 
     def ensure_final_newline(self, content: str) -> Tuple[str, List[str]]:
         changes = []
@@ -834,20 +969,10 @@ class TabFix:
         return ratio > threshold and control_ratio < 0.1
 
     def is_likely_binary(self, content: bytes, filename: str = None) -> bool:
-        if filename:
-            binary_extensions = {
-                '.png', '.jpg', '.jpeg', '.gif', '.bmp', '.ico', '.webp',
-                '.pdf', '.zip', '.tar', '.gz', '.bz2', '.xz', '.rar', '.7z',
-                '.exe', '.dll', '.so', '.dylib', '.class',
-                '.pyc', '.pyo', '.pyd', '.o', '.obj', '.a', '.lib',
-                '.mp3', '.mp4', '.avi', '.mkv', '.mov',
-                '.ttf', '.otf', '.woff', '.woff2',
-                '.db', '.sqlite', '.mdb'
-            }
-            if any(filename.lower().endswith(ext) for ext in binary_extensions):
-                return True
+        if filename and os.path.splitext(filename)[1].lower() in _BINARY_SUFFIXES:
+            return True
 
-        sample = content[:1024] if len(content) > 1024 else content
+        sample = content[:_BINARY_SNIFF_SIZE]
         if b'\x00' in sample:
             return True
 
@@ -925,8 +1050,77 @@ class TabFix:
 
         return ', '.join(parts) if parts else "no changes"
 
+    def build_pipeline(self, args) -> List[_FixPass]:
+        pipeline = []
+
+        if getattr(args, 'fix_trailing', False):
+            def strip_trailing(body: bytes) -> Tuple[bytes, Optional[str]]:
+                body, trailing_count = _TRAILING_WS_RE.subn(b"", body)
+                if not trailing_count:
+                    return body, None
+                self.stats["lines_fixed"] += trailing_count
+                return body, f"Removed trailing spaces: {trailing_count} lines"
+
+            pipeline.append(strip_trailing)
+
+        if getattr(args, 'fix_mixed', False):
+            spaces = b" " * self.spaces_per_tab
+
+            def expand_tabs(body: bytes) -> Tuple[bytes, Optional[str]]:
+                tab_count = body.count(b"\t")
+                if not tab_count:
+                    return body, None
+                self.stats["tabs_replaced"] += tab_count
+                self.stats["lines_fixed"] += len(_TAB_LINE_RE.findall(body))
+                change = f"Tabs → spaces: {tab_count} replaced"
+                return body.replace(b"\t", spaces), change
+
+            pipeline.append(expand_tabs)
+
+        if getattr(args, 'final_newline', False):
+            def add_final_newline(body: bytes) -> Tuple[bytes, Optional[str]]:
+                if not body or body.endswith(b"\n"):
+                    return body, None
+                return body + b"\n", "Added final newline"
+
+            pipeline.append(add_final_newline)
+
+        return pipeline
+
+    def filter_binary_files(self, files: List[Path], args) -> List[Path]:
+        text_files = []
+        for filepath in files:
+            if filepath.suffix.lower() in _BINARY_SUFFIXES:
+                self.skip_binary_file(filepath, args)
+            else:
+                text_files.append(filepath)
+        return text_files
+
+    def skip_binary_file(self, filepath: Path, args) -> bool:
+        if getattr(args, 'verbose', False):
+            print_color(f"Skipped (binary): {filepath}", Colors.DIM)
+        self.stats["binary_files_skipped"] += 1
+        return False
+
+    def needs_processing(self, raw, filepath: Path, args) -> bool:
+        if getattr(args, 'remove_bom', False) and raw[:3] == b"\xef\xbb\xbf":
+            return True
+        if getattr(args, 'format_json', False) and filepath.suffix.lower() == ".json":
+            return True
+        if getattr(args, 'fix_mixed', False) and raw.find(b"\t") != -1:
+            return True
+        if getattr(args, 'fix_trailing', False) and _TRAILING_WS_RE.search(raw):
+            return True
+        if getattr(args, 'final_newline', False) and raw[-1:] != b"\n":
+            return True
+        return False
+
     def process_file(
-        self, filepath: Path, args, gitignore_matcher: Optional[GitignoreMatcher] = None
+        self,
+        filepath: Path,
+        args,
+        gitignore_matcher: Optional[GitignoreMatcher] = None,
+        pipeline: Optional[List[_FixPass]] = None,
     ) -> bool:
         if '.git' in str(filepath.absolute()):
             if getattr(args, 'verbose', False):
@@ -940,6 +1134,10 @@ class TabFix:
             self.stats["files_skipped"] += 1
             return False
 
+        skip_binary = getattr(args, 'skip_binary', True)
+        if skip_binary and filepath.suffix.lower() in _BINARY_SUFFIXES:
+            return self.skip_binary_file(filepath, args)
+
         try:
             if not filepath.is_file():
                 return False
@@ -951,8 +1149,16 @@ class TabFix:
                     print_color(f"Skipped (large file): {filepath} ({size_mb:.1f} MB)", Colors.YELLOW)
                 return False
 
+            if file_size == 0:
+                return False
+
             with open(filepath, "rb") as f:
-                raw_content = f.read()
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    if skip_binary and mm.find(b"\x00", 0, _BINARY_SNIFF_SIZE) != -1:
+                        return self.skip_binary_file(filepath, args)
+                    if not self.needs_processing(mm, filepath, args):
+                        return False
+                    raw_content = mm[:]
         except PermissionError:
             if not getattr(args, 'quiet', False):
                 print_color(f"Permission denied reading: {filepath}", Colors.RED)
@@ -965,54 +1171,44 @@ class TabFix:
             return False
 
         original_raw = raw_content
+        had_bom = raw_content.startswith(b"\xef\xbb\xbf")
+        body = raw_content[3:] if had_bom else raw_content
 
         changes = []
-        try:
-            content = raw_content.decode("utf-8-sig")
-        except UnicodeDecodeError:
-            if getattr(args, 'skip_binary', True):
-                if getattr(args, 'verbose', False):
-                    print_color(f"Skipped (binary/unreadable): {filepath}", Colors.DIM)
-                self.stats["files_skipped"] += 1
-                return False
-            else:
-                if not getattr(args, 'quiet', False):
-                    print_color(f"Cannot decode file: {filepath}", Colors.YELLOW)
-                self.stats["files_skipped"] += 1
-                return False
-
-        had_bom = raw_content.startswith(b"\xef\xbb\xbf")
+        if not body.isascii():
+            try:
+                body.decode("utf-8")
+            except UnicodeDecodeError:
+                if getattr(args, 'skip_binary', True):
+                    if getattr(args, 'verbose', False):
+                        print_color(
+                            f"Skipped (binary/unreadable): {filepath}", Colors.DIM
+                        )
+                    self.stats["files_skipped"] += 1
+                    return False
+                else:
+                    if not getattr(args, 'quiet', False):
+                        print_color(f"Cannot decode file: {filepath}", Colors.YELLOW)
+                    self.stats["files_skipped"] += 1
+                    return False
 
         if getattr(args, 'remove_bom', False) and had_bom:
             changes.append("Removed BOM")
 
         if getattr(args, 'format_json', False) and filepath.suffix.lower() == ".json":
-            formatted, changed = self.format_json(content)
+            formatted, changed = self.format_json(body.decode("utf-8"))
             if changed:
-                content = formatted
+                body = formatted.encode("utf-8")
                 changes.append("Formatted JSON")
                 self.stats["json_formatted"] += 1
 
-        if getattr(args, 'fix_mixed', False):
-            fixed_content, indent_changes = self.fix_mixed_indentation(content)
-            if fixed_content != content:
-                content = fixed_content
-                changes.extend(indent_changes)
-                if indent_changes:
-                    self.stats["tabs_replaced"] += len(indent_changes)
-                    self.stats["lines_fixed"] += len(indent_changes)
+        if pipeline is None:
+            pipeline = self.build_pipeline(args)
 
-        if getattr(args, 'fix_trailing', False):
-            fixed_content, trailing_changes = self.fix_trailing_spaces(content)
-            if fixed_content != content:
-                content = fixed_content
-                changes.extend(trailing_changes)
-                if trailing_changes:
-                    self.stats["lines_fixed"] += len(trailing_changes)
-
-        if getattr(args, 'final_newline', False):
-            content, newline_changes = self.ensure_final_newline(content)
-            changes.extend(newline_changes)
+        for fix_pass in pipeline:
+            body, change = fix_pass(body)
+            if change:
+                changes.append(change)
 
         if not changes:
             return False
@@ -1020,12 +1216,13 @@ class TabFix:
         if getattr(args, 'interactive', False) and not self.interactive_confirm(filepath, changes):
             return False
 
-        if getattr(args, 'keep_bom', False) and had_bom:
-            new_raw = self.add_bom(content.encode("utf-8"))
+        write_bom = getattr(args, 'keep_bom', False) and had_bom
+        if write_bom:
+            unchanged = memoryview(original_raw)[3:] == body
         else:
-            new_raw = content.encode("utf-8")
+            unchanged = original_raw == body
 
-        if new_raw == original_raw:
+        if unchanged:
             return False
 
         if getattr(args, 'backup', False):
@@ -1039,8 +1236,7 @@ class TabFix:
 
         if not getattr(args, 'dry_run', False):
             try:
-                with open(filepath, "wb") as f:
-                    f.write(new_raw)
+                self.write_file(filepath, body, bom=write_bom)
 
                 if had_bom and getattr(args, 'remove_bom', False):
                     self.stats["bom_removed"] += 1
@@ -1071,6 +1267,36 @@ class TabFix:
                 print_color(f"Would fix: {filepath} ({change_summary})", Colors.GREEN)
             return True
 
+    def process_files(
+        self,
+        files: List[Path],
+        args,
+        gitignore_matcher: Optional[GitignoreMatcher] = None,
+        jobs: Optional[int] = None,
+    ) -> Iterator[Tuple[Path, bool]]:
+        jobs = jobs or os.cpu_count() or 1
+        workers = min(jobs, -(-len(files) // _PARALLEL_CHUNK_SIZE))
+
+        if workers <= 1 or getattr(args, 'interactive', False):
+            pipeline = self.build_pipeline(args)
+            for filepath in files:
+                changed = self.process_file(filepath, args, gitignore_matcher, pipeline)
+                yield filepath, changed
+            return
+
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(self.spaces_per_tab, args, gitignore_matcher),
+        ) as executor:
+            results = executor.map(
+                _process_file_in_worker, files, chunksize=_PARALLEL_CHUNK_SIZE
+            )
+            for filepath, (changed, stats) in zip(files, results):
+                for key, value in stats.items():
+                    self.stats[key] += value
+                yield filepath, changed
+
     def compare_files(self, file1: Path, file2: Path, args):
         result = self.compare_files_indentation(file1, file2)
 
@@ -1119,9 +1345,11 @@ class TabFix:
         if args.quiet:
             return
 
-        print_color(f"\n{'='*60}", Colors.CYAN)
-        print_color("PROCESSING STATISTICS", Colors.BOLD + Colors.CYAN)
-        print_color(f"{'='*60}", Colors.CYAN)
+        lines = [
+            (f"\n{'='*60}", Colors.CYAN),
+            ("PROCESSING STATISTICS", Colors.BOLD + Colors.CYAN),
+            (f"{'='*60}", Colors.CYAN),
+        ]
 
         stats_items = [
             (f"Files processed:      ", self.stats["files_processed"], Colors.BLUE),
@@ -1168,14 +1396,43 @@ class TabFix:
         ]
 
         for label, value, color in stats_items:
-            print_color(f"{label}{value:,}", color)
+            lines.append((f"{label}{value:,}", color))
 
         if self.stats["files_processed"] > 0:
             changed_percent = (self.stats["files_changed"] / self.stats["files_processed"]) * 100
-            print_color(
+            lines.append((
                 f"\n{changed_percent:.1f}% of files were modified",
                 Colors.GREEN if changed_percent > 0 else Colors.DIM,
-            )
+            ))
+
+        print_color_lines(lines)
+
+
+_worker_state = {}
+
+
+def _init_worker(
+    spaces_per_tab: int, args, gitignore_matcher: Optional[GitignoreMatcher]
+):
+    if getattr(args, 'no_color', False):
+        disable_color()
+    fixer = TabFix(spaces_per_tab=spaces_per_tab)
+    _worker_state["fixer"] = fixer
+    _worker_state["args"] = args
+    _worker_state["pipeline"] = fixer.build_pipeline(args)
+    _worker_state["gitignore_matcher"] = gitignore_matcher
+
+
+def _process_file_in_worker(filepath: Path) -> Tuple[bool, Dict[str, int]]:
+    fixer = _worker_state["fixer"]
+    fixer.stats = dict.fromkeys(fixer.stats, 0)
+    changed = fixer.process_file(
+        filepath,
+        _worker_state["args"],
+        _worker_state["gitignore_matcher"],
+        _worker_state["pipeline"],
+    )
+    return changed, fixer.stats
 
 
 def main():
@@ -1284,6 +1541,12 @@ Examples:
         "--dry-run", action="store_true", help="Show changes without modifying files"
     )
     parser.add_argument("--backup", action="store_true", help="Create backup files (.bak)")
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        help="Number of worker processes (default: CPU count, 1 disables parallelism)",
+    )
     parser.add_argument("-v", "--verbose", action="store_true", help="Verbose output")
     parser.add_argument("-q", "--quiet", action="store_true", help="Quiet mode (minimal output)")
     parser.add_argument("--no-color", action="store_true", help="Disable colored output")
@@ -1291,8 +1554,7 @@ Examples:
     args = parser.parse_args()
 
     if args.no_color:
-        global Colors
-        Colors = type("Colors", (), {k: "" for k in dir(Colors) if not k.startswith("_")})()
+        disable_color()
 
     if args.remove_bom and args.keep_bom:
         print_color("Cannot use both --remove-bom and --keep-bom", Colors.RED)
@@ -1307,8 +1569,9 @@ Examples:
         return
 
     files_to_process = []
+    git_mode = args.git_staged or args.git_unstaged or args.git_all_changed
 
-    if args.git_staged or args.git_unstaged or args.git_all_changed:
+    if git_mode:
         if args.git_staged:
             files = fixer.get_git_files("staged")
         elif args.git_unstaged:
@@ -1317,60 +1580,55 @@ Examples:
             files = fixer.get_git_files("all_changed")
 
         files_to_process.extend(files)
-    else:
-        for path_str in args.paths or ["."]:
-            path = Path(path_str)
-
-            if not path.exists():
-                if not args.quiet:
-                    print_color(f"Warning: Path not found: {path}", Colors.YELLOW)
-                continue
-
-            if path.is_file():
-                files_to_process.append(path)
-            elif path.is_dir():
-                if args.recursive:
-                    pattern = "**/*"
-                else:
-                    pattern = "*"
-
-                for filepath in path.glob(pattern):
-                    if filepath.is_file():
-                        files_to_process.append(filepath)
-
-    if not files_to_process:
-        if not args.quiet:
-            print_color("No files to process", Colors.YELLOW)
-        return
 
     gitignore_matcher = None
-    if not args.no_gitignore and files_to_process:
-        root_dir = Path.cwd()
-        for filepath in files_to_process:
-            if filepath.is_absolute():
-                potential_root = filepath.parent
-            else:
-                potential_root = (Path.cwd() / filepath).parent
-
-            gitignore_path = potential_root / ".gitignore"
-            if gitignore_path.exists():
-                root_dir = potential_root
-                break
+    if not args.no_gitignore:
+        if git_mode:
+            search_paths = files_to_process
+        else:
+            search_paths = [Path(p) for p in args.paths or ["."]]
 
+        root_dir = find_gitignore_root(search_paths)
         gitignore_matcher = GitignoreMatcher(root_dir)
         if args.verbose:
             print_color(f"Using .gitignore from: {root_dir}", Colors.CYAN)
 
     processed_files = []
+    skipped = 0
     for filepath in files_to_process:
         if gitignore_matcher and gitignore_matcher.should_ignore(filepath):
+            skipped += 1
             continue
         processed_files.append(filepath)
 
-    if args.verbose and gitignore_matcher:
-        skipped = len(files_to_process) - len(processed_files)
-        if skipped > 0:
-            print_color(f"Skipping {skipped} files due to .gitignore", Colors.DIM)
+    if not git_mode:
+        for path_str in args.paths or ["."]:
+            path = Path(path_str)
+
+            if not path.exists():
+                if not args.quiet:
+                    print_color(f"Warning: Path not found: {path}", Colors.YELLOW)
+                continue
+
+            if path.is_file():
+                if gitignore_matcher and gitignore_matcher.should_ignore(path):
+                    skipped += 1
+                    continue
+                processed_files.append(path)
+            elif path.is_dir():
+                ignored = []
+                processed_files.extend(
+                    iter_files(path, args.recursive, gitignore_matcher, ignored)
+                )
+                skipped += len(ignored)
+
+    if args.verbose and skipped > 0:
+        print_color(f"Skipping {skipped} files due to .gitignore", Colors.DIM)
+
+    processed_files = list(dict.fromkeys(processed_files))
+
+    if args.skip_binary:
+        processed_files = fixer.filter_binary_files(processed_files, args)
 
     if not processed_files:
         if not args.quiet:
@@ -1380,34 +1638,37 @@ Examples:
                 print_color("No files to process in current directory.", Colors.YELLOW)
         return
 
+    total = len(processed_files)
+    results = fixer.process_files(
+        processed_files, args, gitignore_matcher, jobs=args.jobs
+    )
+    show_fallback_progress = args.progress and not HAS_TQDM and not args.quiet
+
     if args.progress and HAS_TQDM and not args.interactive:
         if not args.quiet:
-            print_color(f"Processing {len(processed_files):,} files...", Colors.CYAN)
-        iterator = tqdm(processed_files, desc="Processing", unit="file", disable=args.quiet)
-    elif args.progress and not HAS_TQDM and not args.quiet:
+            print_color(f"Processing {total:,} files...", Colors.CYAN)
+        iterator = tqdm(
+            results, total=total, desc="Processing", unit="file", disable=args.quiet
+        )
+    elif show_fallback_progress:
         print_color("Progress: Install 'tqdm' for better progress bar", Colors.YELLOW)
-        print_color(f"Processing {len(processed_files):,} files...", Colors.CYAN)
-        iterator = enumerate(processed_files)
-        total = len(processed_files)
+        print_color(f"Processing {total:,} files...", Colors.CYAN)
+        iterator = enumerate(results)
     else:
-        iterator = processed_files
+        iterator = results
 
     for item in iterator:
-        if args.progress and not HAS_TQDM and not args.interactive:
-            idx, filepath = item
-            if idx % 100 == 0 and not args.quiet:
+        if show_fallback_progress:
+            idx, _ = item
+            if idx % 100 == 0:
                 percent = (idx / total) * 100
                 print_color(
                     f"Progress: {idx:,}/{total:,} files ({percent:.1f}%)",
                     Colors.CYAN,
                     end="\r",
                 )
-            fixer.process_file(filepath, args, gitignore_matcher)
-        else:
-            filepath = item
-            fixer.process_file(filepath, args, gitignore_matcher)
 
-    if args.progress and not HAS_TQDM and not args.quiet and not args.interactive:
+    if show_fallback_progress:
         print()
 
     fixer.print_stats(args)
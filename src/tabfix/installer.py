@@ -2,7 +2,11 @@
 import sys
 import subprocess
 import os
-from typing import Optional
+import importlib.util
+from typing import List, Optional
+
+PIP_INSTALL = [sys.executable, "-m", "pip", "install"]
+REPO_URL = "https://github.com/hairpin01/tabfix.git"
 
 
 class Colors:
@@ -15,8 +19,11 @@ class Colors:
     BOLD = "\033[1m"
 
 
+_USE_COLOR = sys.stdout.isatty() and not os.environ.get("NO_COLOR")
+
+
 def print_color(text: str, color: str = Colors.END, end: str = "\n"):
-    if sys.stdout.isatty():
+    if _USE_COLOR:
         print(f"{color}{text}{Colors.END}", end=end)
     else:
         print(text, end=end)
@@ -27,26 +34,19 @@ def is_interactive() -> bool:
 
 
 def check_tabfix_installed() -> bool:
-    try:
-        subprocess.run([sys.executable, "-c", "import tabfix"], 
-                      capture_output=True, check=True)
-        return True
-    except subprocess.CalledProcessError:
-        return False
+    return importlib.util.find_spec("tabfix") is not None
 
 
-def run_command(cmd: str) -> bool:
+def run_command(argv: List[str], cwd: Optional[str] = None) -> bool:
     try:
-        result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
+        result = subprocess.run(argv, cwd=cwd)
         
         if result.returncode != 0:
-            if result.stderr:
-                print_color(f"Error: {result.stderr}", Colors.RED)
+            print_color(
+                f"Error: {argv[0]} exited with code {result.returncode}", Colors.RED
+            )
             return False
         
-        if result.stdout:
-            print_color(result.stdout, Colors.BLUE)
-        
         return True
     except Exception as e:
         print_color(f"Failed to run command: {e}", Colors.RED)
@@ -56,10 +56,10 @@ def run_command(cmd: str) -> bool:
 def install_or_update() -> bool:
     if check_tabfix_installed():
         print_color("Updating tabfix from PyPI...", Colors.BLUE)
-        return run_command(f"{sys.executable} -m pip install --upgrade tabfix-tool")
+        return run_command(PIP_INSTALL + ["--upgrade", "tabfix-tool"])
     else:
         print_color("Installing tabfix from PyPI...", Colors.BLUE)
-        return run_command(f"{sys.executable} -m pip install tabfix-tool")
+        return run_command(PIP_INSTALL + ["tabfix-tool"])
 
 
 def main():
@@ -87,13 +87,16 @@ def main():
             success = install_or_update()
         elif choice == "2":
             print_color("Installing from GitHub...", Colors.BLUE)
-            success = run_command(f"{sys.executable} -m pip install git+https://github.com/hairpin01/tabfix.git")
+            success = run_command(PIP_INSTALL + [f"git+{REPO_URL}"])
         elif choice == "3":
             print_color("Installing editable from current directory...", Colors.BLUE)
-            success = run_command(f"{sys.executable} -m pip install -e .")
+            success = run_command(PIP_INSTALL + ["-e", "."])
         elif choice == "4":
             print_color("Cloning and installing from GitHub...", Colors.BLUE)
-            success = run_command("git clone https://github.com/hairpin01/tabfix.git && cd tabfix && pip install -e .")
+            success = (
+                run_command(["git", "clone", "--depth", "1", REPO_URL])
+                and run_command(PIP_INSTALL + ["-e", "."], cwd="tabfix")
+            )
         elif choice == "5":
             print_color("Checking installation...", Colors.BLUE)
             success = check_tabfix_installed()